@@ -0,0 +1,64 @@
+"""
+视频 API 错误识别
+把上游返回的英文错误内容归类，翻译成给用户看的中文提示
+"""
+
+import re
+
+# 视频 API 错误关键词 -> 中文提示（按优先级排列，越靠前优先级越高）
+_API_ERROR_CATEGORIES = [
+    # 内容策略违规相关
+    (['content policy', 'policy violation', 'violat', 'inappropriate', 'nsfw', 'safety'],
+     "❌ 内容审核未通过：图片可能包含敏感、暴力或不适内容，请更换图片后重试"),
+    # 速率限制相关
+    (['rate limit', 'too many requests', 'quota exceeded', '429'],
+     "⏳ API请求频率超限：系统将在稍后自动重试，请耐心等待"),
+    # 模型/服务不可用
+    (['model not available', 'service unavailable', 'temporarily unavailable', '503'],
+     "🔧 视频生成服务暂时不可用，系统将自动重试"),
+    # 图片格式/尺寸问题
+    (['invalid image', 'unsupported format', 'image too', 'resolution'],
+     "🖼️ 图片格式或尺寸不符合要求，请使用标准JPG/PNG格式（推荐9:16竖版）"),
+    # 认证/权限问题
+    (['unauthorized', 'authentication', 'invalid key', '401', '403'],
+     "🔑 API认证失败，请联系管理员检查API密钥配置"),
+    # 请求参数问题
+    (['invalid request', 'bad request', 'parameter', '400'],
+     "⚠️ 请求参数错误，请检查提示词或图片格式"),
+    # 服务器错误
+    (['internal server error', '500', 'server error'],
+     "🔥 视频生成服务器内部错误，系统将自动重试"),
+]
+# 所有类别合成一个带命名分组（c0, c1, ...）的正则，整段文本只扫描一遍。
+# 整体包在零宽前瞻里：匹配不消耗字符，每个起始位置都会被尝试，低优先级关键词
+# 不会吞掉与之重叠的高优先级关键词（如 "image too many requests" 仍判为频率超限）
+_API_ERROR_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<c{i}>{'|'.join(map(re.escape, keywords))})"
+        for i, (keywords, _) in enumerate(_API_ERROR_CATEGORIES)
+    ) + ")"
+)
+_API_ERROR_MESSAGES = [message for _, message in _API_ERROR_CATEGORIES]
+
+
+def detect_api_error_cn(response_content: str) -> str:
+    """智能检测API响应中的错误并返回对应的中文提示。
+    
+    Args:
+        response_content: API返回的完整响应内容
+        
+    Returns:
+        中文错误提示信息
+    """
+    best = None
+    for m in _API_ERROR_RE.finditer(response_content.lower()):
+        idx = int(m.lastgroup[1:])
+        if best is None or idx < best:
+            best = idx
+            if best == 0:
+                break
+    if best is not None:
+        return _API_ERROR_MESSAGES[best]
+    
+    # 默认提示
+    return f"❓ 视频URL解析失败：{response_content[:100]}..."
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Migration script to add composite indexes for hot query predicates
+(public gallery, per-user stats, admin activity window, queue list).
+Run this inside the backend container:
+docker compose exec backend python migrate_indexes.py
+"""
+
+import os
+import sys
+from sqlalchemy import text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import engine
+
+INDEXES = [
+    ("ix_video_public",
+     "CREATE INDEX IF NOT EXISTS ix_video_public ON video_queue (created_at) "
+     "WHERE is_shared = true AND status IN ('done', 'archived')"),
+    ("ix_video_user_created",
+     "CREATE INDEX IF NOT EXISTS ix_video_user_created ON video_queue (user_id, created_at)"),
+    ("ix_video_active_created",
+     "CREATE INDEX IF NOT EXISTS ix_video_active_created ON video_queue (created_at) "
+     "WHERE status != 'archived'"),
+    ("ix_savedimage_user_created",
+     "CREATE INDEX IF NOT EXISTS ix_savedimage_user_created ON saved_images (user_id, created_at)"),
+    ("ix_user_activities_created",
+     "CREATE INDEX IF NOT EXISTS ix_user_activities_created ON user_activities (created_at)"),
+]
+
+def migrate():
+    for name, ddl in INDEXES:
+        # One transaction per index so a failure doesn't abort the rest
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(ddl))
+            print(f"✅ Created index {name}")
+        except Exception as e:
+            print(f"⚠️ {name}: {e}")
+    
+    print("✅ Migration completed successfully!")
+
+if __name__ == "__main__":
+    migrate()
@@ -11,6 +11,7 @@ import asyncio
 import logging
 import socket
 import os
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import redis.asyncio as aioredis
@@ -57,6 +58,10 @@ class TaskQueue:
     def __init__(self, redis_url: str = "redis://redis:6379/0"):
         self.redis_url = redis_url
         self._redis: Optional[aioredis.Redis] = None
+        # get_queue_stats 短时缓存 (admin 面板高频轮询)
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_time: float = 0
+        self._stats_cache_ttl: float = 1.0
         
     async def connect(self):
         """Initialize Redis connection."""
@@ -263,21 +268,25 @@ class TaskQueue:
     # --- Queue Statistics ---
     
     async def get_queue_stats(self) -> Dict[str, Any]:
-        """Get overall queue statistics."""
+        """Get overall queue statistics (cached for 1s, single pipelined round trip)."""
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache_time < self._stats_cache_ttl:
+            return self._stats_cache
+        
+        task_types = ("video_gen", "image_gen", "story_chain")
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for task_type in task_types:
+                pipe.zcard(f"queue:{task_type}")
+            pipe.hgetall("tasks")
+            results = await pipe.execute()
+        
         stats = {
-            "video_gen": {
-                "pending": await self.redis.zcard("queue:video_gen"),
-            },
-            "image_gen": {
-                "pending": await self.redis.zcard("queue:image_gen"),
-            },
-            "story_chain": {
-                "pending": await self.redis.zcard("queue:story_chain"),
-            }
+            task_type: {"pending": pending}
+            for task_type, pending in zip(task_types, results)
         }
         
         # Count processing tasks
-        all_tasks = await self.redis.hgetall("tasks")
+        all_tasks = results[-1]
         for task_json in all_tasks.values():
             task = json.loads(task_json)
             if task["status"] == "processing":
@@ -285,6 +294,8 @@ class TaskQueue:
                 if task_type in stats:
                     stats[task_type]["processing"] = stats[task_type].get("processing", 0) + 1
         
+        self._stats_cache = stats
+        self._stats_cache_time = now
         return stats
     
     # --- Pub/Sub for Real-time Updates ---
@@ -335,6 +346,7 @@ class ConcurrencyLimiter:
         self._config_cache = {}
         self._cache_time = None
         self._cache_ttl = 10  # Reduced from 30s to 10s for faster config updates
+        self._slot_conditions: Dict[str, asyncio.Condition] = {}  # task_type -> 本进程等待槽位的协程
     
     async def _get_config(self) -> dict:
         """Get config with caching to reduce DB queries."""
@@ -395,10 +407,42 @@ class ConcurrencyLimiter:
             return False
         return True
     
+    def _slot_condition(self, task_type: str) -> asyncio.Condition:
+        cond = self._slot_conditions.get(task_type)
+        if cond is None:
+            cond = self._slot_conditions[task_type] = asyncio.Condition()
+        return cond
+    
+    async def acquire_global_wait(self, task_type: str, timeout: float = 600,
+                                  slot_ttl: int = 300, poll_interval: float = 5.0) -> bool:
+        """
+        Wait up to `timeout` seconds for a global execution slot.
+        本进程内 release_global 会立即唤醒等待者；其他 worker 释放的槽位只能靠
+        poll_interval 兜底重试发现（计数在 Redis 里，Condition 只在进程内有效）。
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        cond = self._slot_condition(task_type)
+        while True:
+            if await self.acquire_global(task_type, timeout=slot_ttl):
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            async with cond:
+                try:
+                    await asyncio.wait_for(cond.wait(), min(remaining, poll_interval))
+                except asyncio.TimeoutError:
+                    pass
+    
     async def release_global(self, task_type: str):
-        """Release a global execution slot."""
+        """Release a global execution slot and wake one local waiter."""
         key = f"concurrent:{task_type}"
         await self.redis.decr(key)
+        cond = self._slot_conditions.get(task_type)
+        if cond is not None:
+            async with cond:
+                cond.notify()
     
     async def can_acquire_user(self, user_id: int, task_type: str) -> bool:
         """Check if a user can start a new task."""
@@ -426,9 +470,48 @@ class ConcurrencyLimiter:
         await self.redis.decr(key)
 
 
+class RequestThrottle:
+    """
+    Cluster-wide GCRA request throttle.
+    
+    State (theoretical arrival time) lives in Redis and is updated by a single
+    Lua script, so every uvicorn worker shares the same per-host rate limit.
+    """
+    
+    # KEYS[1] = throttle key; ARGV = now, emission_interval, burst, cost
+    # Returns how long the caller must wait (seconds, as string) - the slot is reserved either way.
+    GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local burst = tonumber(ARGV[3])
+local increment = interval * tonumber(ARGV[4])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local wait = (tat - now) - burst + increment
+local new_tat = tat + increment
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000) + 1000)
+return tostring(wait)
+"""
+    
+    def __init__(self, redis: aioredis.Redis):
+        self.redis = redis
+        self._script = redis.register_script(self.GCRA_SCRIPT)
+    
+    async def reserve(self, key: str, emission_interval: float, burst: float, cost: int = 1) -> float:
+        """Reserve `cost` cells for `key`; returns seconds to wait before sending (<= 0 means now)."""
+        wait = await self._script(
+            keys=[f"throttle:{key}"],
+            args=[time.time(), emission_interval, burst, cost]
+        )
+        return float(wait)
+
+
 # Singleton instance
 task_queue: Optional[TaskQueue] = None
 concurrency_limiter: Optional[ConcurrencyLimiter] = None
+request_throttle: Optional[RequestThrottle] = None
 
 
 async def get_task_queue() -> TaskQueue:
@@ -441,6 +524,15 @@ async def get_task_queue() -> TaskQueue:
     return task_queue
 
 
+async def get_request_throttle() -> RequestThrottle:
+    """Get or create the global RequestThrottle instance."""
+    global request_throttle
+    if request_throttle is None:
+        queue = await get_task_queue()
+        request_throttle = RequestThrottle(queue.redis)
+    return request_throttle
+
+
 async def get_concurrency_limiter(config_getter=None) -> ConcurrencyLimiter:
     """Get or create the global ConcurrencyLimiter instance."""
     global concurrency_limiter
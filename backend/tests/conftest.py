@@ -0,0 +1,5 @@
+import os
+import sys
+
+# backend 模块是平铺导入的（uvicorn main:app），测试里同样把 backend/ 放到 sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from api_errors import _API_ERROR_CATEGORIES, detect_api_error_cn
+
+
+def detect_api_error_cn_reference(response_content: str) -> str:
+    """原实现：按优先级依次对小写文本做子串查找。"""
+    content_lower = response_content.lower()
+    for keywords, message in _API_ERROR_CATEGORIES:
+        if any(kw in content_lower for kw in keywords):
+            return message
+    return f"❓ 视频URL解析失败：{response_content[:100]}..."
+
+
+@pytest.mark.parametrize("content", [
+    "Error: image too many requests",        # "image too" 与 "too many requests" 重叠
+    "invalid image too large, rate limit",
+    "unsupported format 429",
+    "Bad Request: parameter resolution 4290",
+    "internal server error 5003",             # "500" 与 "503" 重叠
+    "service unavailable (503) nsfw",
+    "HTTP 401 Unauthorized",
+    "INVALID KEY",
+    "violation of content policy",
+    "no keywords here at all",
+    "",
+])
+def test_matches_reference_on_overlapping_keywords(content):
+    assert detect_api_error_cn(content) == detect_api_error_cn_reference(content)
+
+
+def test_overlap_prefers_higher_priority_category():
+    assert detect_api_error_cn("Error: image too many requests").startswith("⏳")
+
+
+def test_matches_reference_on_random_keyword_mixes():
+    rng = random.Random(0)
+    keywords = [kw for kws, _ in _API_ERROR_CATEGORIES for kw in kws]
+    fragments = keywords + [kw[:len(kw) // 2] for kw in keywords] + [" ", "x", "Error: ", "\n"]
+    for _ in range(2000):
+        content = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 6)))
+        if rng.random() < 0.5:
+            content = content.upper()
+        assert detect_api_error_cn(content) == detect_api_error_cn_reference(content), content
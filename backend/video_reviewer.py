@@ -16,6 +16,9 @@ from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# 审查所需的系统配置 key（一次 IN 查询取回）
+REVIEW_CONFIG_KEYS = ("review_enabled", "review_api_url", "review_api_key", "review_model_name")
+
 # 审查提示词模板
 REVIEW_PROMPT = """**【重要】请务必使用简体中文进行回复，所有评估结论、描述文字均需使用中文。**
 
@@ -326,17 +329,21 @@ async def trigger_video_review(
     
     db = db_session()
     try:
-        # 获取审查配置
-        review_enabled = db.query(SystemConfig).filter(SystemConfig.key == "review_enabled").first()
-        if not review_enabled or review_enabled.value.lower() != "true":
+        # 获取审查配置：一次 IN 查询只取需要的 key/value 列
+        review_config = dict(
+            db.query(SystemConfig.key, SystemConfig.value)
+            .filter(SystemConfig.key.in_(REVIEW_CONFIG_KEYS))
+            .all()
+        )
+        if (review_config.get("review_enabled") or "").lower() != "true":
             logger.info(f"Video review disabled, skipping review for {video_id}")
             return
         
-        review_api_url = db.query(SystemConfig).filter(SystemConfig.key == "review_api_url").first()
-        review_api_key = db.query(SystemConfig).filter(SystemConfig.key == "review_api_key").first()
-        review_model = db.query(SystemConfig).filter(SystemConfig.key == "review_model_name").first()
+        review_api_url = review_config.get("review_api_url")
+        review_api_key = review_config.get("review_api_key")
+        review_model = review_config.get("review_model_name")
         
-        if not review_api_url or not review_api_url.value or not review_api_key or not review_api_key.value:
+        if not review_api_url or not review_api_key:
             logger.warning(f"Review API not configured, skipping review for {video_id}")
             return
         
@@ -354,9 +361,9 @@ async def trigger_video_review(
         review_result = await review_video(
             video_path=video_path,
             video_prompt=video_prompt,
-            api_url=review_api_url.value,
-            api_key=review_api_key.value,
-            model_name=review_model.value if review_model else "gpt-4o"
+            api_url=review_api_url,
+            api_key=review_api_key,
+            model_name=review_model if review_model is not None else "gpt-4o"
         )
         
         # 更新审查结果
@@ -15,6 +15,16 @@ import redis.asyncio as aioredis
 
 logger = logging.getLogger(__name__)
 
+# orjson 序列化更快；未安装时回退到标准库（与 Starlette send_json 输出一致）
+try:
+    import orjson
+
+    def dumps_message(message: Dict[str, Any]) -> str:
+        return orjson.dumps(message).decode("utf-8")
+except ImportError:
+    def dumps_message(message: Dict[str, Any]) -> str:
+        return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
 
 class ConnectionManager:
     """
@@ -127,16 +137,38 @@ class ConnectionManager:
         if user_id not in self.user_connections:
             return
         
-        disconnected = []
-        for websocket in self.user_connections[user_id]:
+        await self._send_text_to_user(user_id, dumps_message(message))
+    
+    @staticmethod
+    async def _fan_out(sockets: List[WebSocket], text: str) -> List[tuple]:
+        """
+        Send the same pre-serialized payload to many sockets concurrently.
+        
+        Returns (websocket, exception) pairs for sockets that failed.
+        """
+        if len(sockets) == 1:
             try:
-                await websocket.send_json(message)
+                await sockets[0].send_text(text)
+                return []
             except Exception as e:
-                logger.warning(f"Failed to send to user {user_id}: {e}")
-                disconnected.append(websocket)
+                return [(sockets[0], e)]
+        
+        results = await asyncio.gather(
+            *(ws.send_text(text) for ws in sockets),
+            return_exceptions=True
+        )
+        return [(ws, r) for ws, r in zip(sockets, results) if isinstance(r, Exception)]
+    
+    async def _send_text_to_user(self, user_id: int, text: str):
+        """Send a pre-serialized message to all of a user's connections."""
+        if user_id not in self.user_connections:
+            return
+        
+        failed = await self._fan_out(list(self.user_connections[user_id]), text)
         
         # Clean up disconnected sockets
-        for ws in disconnected:
+        for ws, e in failed:
+            logger.warning(f"Failed to send to user {user_id}: {e}")
             await self.disconnect(ws, user_id)
     
     async def broadcast_to_admins(self, message: Dict[str, Any]):
@@ -146,21 +178,23 @@ class ConnectionManager:
         Args:
             message: Message data to broadcast
         """
-        disconnected = []
-        for websocket in self.admin_connections:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.warning(f"Failed to broadcast to admin: {e}")
-                disconnected.append(websocket)
+        if not self.admin_connections:
+            return
+        
+        # Serialize once for all admin sockets
+        text = dumps_message(message)
+        for _, e in await self._fan_out(list(self.admin_connections), text):
+            logger.warning(f"Failed to broadcast to admin: {e}")
         
         # Note: We don't remove admin connections here as they're also
         # in user_connections and will be cleaned up there
     
     async def broadcast_to_all(self, message: Dict[str, Any]):
         """Broadcast a message to all connected users."""
-        for user_id in list(self.user_connections.keys()):
-            await self.send_to_user(user_id, message)
+        text = dumps_message(message)
+        user_ids = list(self.user_connections.keys())
+        if user_ids:
+            await asyncio.gather(*(self._send_text_to_user(uid, text) for uid in user_ids))
     
     def get_online_users(self) -> List[Dict[str, Any]]:
         """Get list of currently online users with metadata."""
@@ -189,6 +223,12 @@ class ConnectionManager:
             user_id: User's ID
             activity: Description of current activity
         """
+        info = self.connection_info.get(user_id)
+        if info is not None and info.get("current_activity") == activity:
+            # 状态未变化（客户端重复上报），只刷新时间戳，不再广播
+            info["last_activity"] = datetime.now().isoformat()
+            return
+        
         logger.info(f"Updating user {user_id} activity to: '{activity}'")
         
         if user_id in self.connection_info:
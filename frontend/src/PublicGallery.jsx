@@ -40,6 +40,22 @@ const PublicGallery = ({ onLoginClick, siteConfig }) => {
         }
     };
 
+    // List responses carry a truncated prompt; load the full one when opening a video
+    const openVideo = async (vid) => {
+        setVideoError(false);
+        setSelectedVideo(vid);
+        if (!vid.prompt_truncated) return;
+        try {
+            const res = await fetch(`/api/v1/public/videos/${vid.id}`);
+            if (res.ok) {
+                const data = await res.json();
+                setSelectedVideo(prev => (prev && prev.id === vid.id ? { ...prev, prompt: data.prompt } : prev));
+            }
+        } catch (err) {
+            console.error("Failed to fetch video detail", err);
+        }
+    };
+
     // Use window scroll event for infinite loading
     useEffect(() => {
         const handleScroll = () => {
@@ -76,7 +92,7 @@ const PublicGallery = ({ onLoginClick, siteConfig }) => {
                     <VideoCard
                         key={vid.id}
                         video={vid}
-                        onClick={() => { setVideoError(false); setSelectedVideo(vid); }}
+                        onClick={() => openVideo(vid)}
                     />
                 ))}
             </div>